@@ -4,12 +4,17 @@ from chatbot import FootballChatbot
 import logger_config 
 import logging
 import os
-from rss_manager import fetch_rss_feeds
+from fixture_manager import FixtureManager
+from headline_index import HeadlineIndex
+from config import NEWS_PAGE_SIZE
+from models import BotResponse
 
 logger = logging.getLogger(__name__)
 
 INPUT_KEY = "user_input"
 FORM_PROMPT_KEY = "form_submitted_prompt" 
+FORM_RESPONSE_KEY = "form_local_response"
+FORM_REQUEST_TYPE_KEY = "form_request_type"
 
 CARD_DATA = {
     "Analysis Match": "Provide a detailed **tactical analysis** for the most recent match involving {team_a} as home and {team_b} as away. Focus specifically on the **Winning Team's Formation or a Key Player's Role** and the key **Moment or Statistic** that defined the outcome.",
@@ -26,6 +31,71 @@ RSS_FEEDS = [
 ]
 
 
+@st.cache_resource
+def get_fixture_manager():
+    logger.info("Loading local fixture index.")
+    return FixtureManager()
+
+
+@st.cache_resource
+def get_headline_index():
+    logger.info("Creating shared headline index.")
+    return HeadlineIndex()
+
+
+def render_news_card(article):
+    with st.container(border=True):
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            if article.get("image"):
+                st.image(article["image"], use_container_width=True)
+            else:
+                st.image("https://upload.wikimedia.org/wikipedia/commons/7/75/No_image_available.png", use_container_width=True)
+        with col2:
+            st.subheader(article["title"])
+            st.write(f"🕒 {article['published']}")
+            st.markdown(f"[Read more ▶️]({article['link']})")
+    st.markdown("---")
+
+
+def render_news_tab():
+    st.header("Latest Football News")
+    headline_index = get_headline_index()
+    headline_index.refresh(RSS_FEEDS)
+
+    search_query = st.text_input("Search headlines", key="news_search", placeholder="e.g., Chelsea")
+    if st.session_state.get("news_last_search") != search_query:
+        st.session_state["news_last_search"] = search_query
+        st.session_state["news_page"] = 1
+    page = st.session_state.get("news_page", 1)
+
+    articles, total = headline_index.search(search_query, page=page, page_size=NEWS_PAGE_SIZE)
+    page_count = HeadlineIndex.page_count(total, NEWS_PAGE_SIZE)
+    if page > page_count:
+        page = st.session_state["news_page"] = page_count
+        articles, total = headline_index.search(search_query, page=page, page_size=NEWS_PAGE_SIZE)
+    logger.info(f"News tab: '{search_query}' matched {total} headlines, showing page {page}/{page_count}.")
+
+    if not articles:
+        st.warning("No news articles found.")
+        return
+
+    for article in articles:
+        render_news_card(article)
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("◀ Previous", key="news_prev", disabled=page <= 1, use_container_width=True):
+            st.session_state["news_page"] = page - 1
+            st.rerun()
+    with col_page:
+        st.write(f"Page {page} of {page_count} ({total} articles)")
+    with col_next:
+        if st.button("Next ▶", key="news_next", disabled=page >= page_count, use_container_width=True):
+            st.session_state["news_page"] = page + 1
+            st.rerun()
+
+
 def quick_start_cards():
     st.markdown("### Quick Actions")
 
@@ -157,6 +227,12 @@ def render_conditional_form():
                         single_input_val = st.session_state["single_input_name"].strip()
                         if active_form == "schedule":
                             full_prompt = base_prompt.format(league=single_input_val)
+                            fixture_manager = get_fixture_manager()
+                            fixture_manager.refresh()
+                            schedule_answer = fixture_manager.answer_schedule(single_input_val)
+                            if schedule_answer:
+                                logger.info("Schedule answered from local fixture index.")
+                                st.session_state[FORM_RESPONSE_KEY] = BotResponse(message=schedule_answer, references=[])
                         else:
                             full_prompt = base_prompt.format(name=single_input_val)
                         logger.info("Generated prompt from single-input form.")
@@ -168,6 +244,7 @@ def render_conditional_form():
                 if full_prompt:
                     logger.info(f"Storing generated prompt to session state and re-running.")
                     st.session_state[FORM_PROMPT_KEY] = full_prompt # Store the generated prompt
+                    st.session_state[FORM_REQUEST_TYPE_KEY] = active_form  # Selects the retrieval profile
                     st.session_state["active_form"] = None         # Hide the form
                     st.rerun()                                     # Trigger immediate processing in main()
 
@@ -236,25 +313,7 @@ def main():
     tab1, tab2 = st.tabs(["News", "Chatbot"])
 
     with tab1:
-        st.header("Latest Football News")
-        articles = fetch_rss_feeds(RSS_FEEDS, limit=10)
-        if articles:
-            for article in articles:
-                with st.container(border=True):
-                    col1, col2 = st.columns([1, 3])
-                    with col1:
-                        if article.get("image"):
-                            st.image(article["image"], use_container_width=True)
-                        else:
-                            st.image("https://upload.wikimedia.org/wikipedia/commons/7/75/No_image_available.png", use_container_width=True)
-                    with col2:
-                        st.subheader(article["title"])
-                        st.write(f"🕒 {article['published']}")
-                        st.markdown(f"[Read more ▶️]({article['link']})")
-                st.markdown("---")
-
-        else:
-            st.warning("No news articles found.")
+        render_news_tab()
             
     with tab2:
         if "messages" not in st.session_state:
@@ -296,12 +355,18 @@ def main():
             logger.info(f"User prompt: '{prompt_to_process}'")
             st.chat_message("user", avatar="https://upload.wikimedia.org/wikipedia/commons/a/aa/Message-icon-white-background.png?20210611024859").write(prompt_to_process)
             st.session_state.messages.append({"role": "user", "content": prompt_to_process})
+            local_response = st.session_state.pop(FORM_RESPONSE_KEY, None)
+            request_type = st.session_state.pop(FORM_REQUEST_TYPE_KEY, "chat")
 
             with st.chat_message("assistant", avatar="https://upload.wikimedia.org/wikipedia/commons/thumb/1/1d/Google_Gemini_icon_2025.svg/640px-Google_Gemini_icon_2025.svg.png"):
                 with st.spinner("Searching news and generating response..."):
                     try:
-                        logger.info("Generating chatbot response...")
-                        response = st.session_state.chatbot.generate_response(prompt_to_process)
+                        if local_response:
+                            logger.info("Using locally generated response.")
+                            response = local_response
+                        else:
+                            logger.info("Generating chatbot response...")
+                            response = st.session_state.chatbot.generate_response(prompt_to_process, request_type=request_type)
                         st.write(response.message)
                         logger.info("Response generated and displayed successfully.")
                         
@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from typing import Dict
+import logger_config
+import logging
+
+
+class ArticleStore:
+    """Process-wide, content-addressed store for article text.
+
+    Text is keyed by its SHA-256, so every session citing the same story shares one copy.
+    Entries are reference counted by their NewsArticle handles; once unreferenced they stay
+    in a bounded LRU so a re-fetched article does not need to be stored again.
+    """
+
+    def __init__(self, max_unreferenced: int = 256):
+        self.logger = logging.getLogger(__name__)
+        self.max_unreferenced = max_unreferenced
+        self._texts: Dict[str, str] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._unreferenced: "OrderedDict[str, None]" = OrderedDict()
+        # Releases from NewsArticle.__del__ land here without taking the lock, because garbage
+        # collection can run while this thread is already inside a locked section.
+        self._pending_releases: "deque[str]" = deque()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def acquire(self, text: str) -> str:
+        """Store `text` (if new), take a reference to it and return its hash."""
+        key = self.content_hash(text)
+        with self._lock:
+            self._drain_pending()
+            if key not in self._texts:
+                self._texts[key] = text
+            self._refcounts[key] = self._refcounts.get(key, 0) + 1
+            self._unreferenced.pop(key, None)
+        return key
+
+    def release(self, key: str):
+        with self._lock:
+            self._drain_pending()
+            self._release(key)
+
+    def release_later(self, key: str):
+        """Queue a release without locking; safe to call from __del__ and finalizers."""
+        self._pending_releases.append(key)
+
+    def _drain_pending(self):
+        while self._pending_releases:
+            self._release(self._pending_releases.popleft())
+
+    def _release(self, key: str):
+        count = self._refcounts.get(key, 0) - 1
+        if count > 0:
+            self._refcounts[key] = count
+            return
+        self._refcounts.pop(key, None)
+        if key in self._texts:
+            self._unreferenced[key] = None
+            while len(self._unreferenced) > self.max_unreferenced:
+                evicted, _ = self._unreferenced.popitem(last=False)
+                del self._texts[evicted]
+
+    def refcount(self, key: str) -> int:
+        with self._lock:
+            self._drain_pending()
+            return self._refcounts.get(key, 0)
+
+    def get(self, key: str) -> str:
+        with self._lock:
+            self._drain_pending()
+            if key in self._unreferenced:
+                self._unreferenced.move_to_end(key)
+            return self._texts.get(key, "")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._drain_pending()
+            return {
+                "entries": len(self._texts),
+                "referenced": len(self._refcounts),
+                "bytes": sum(len(text.encode("utf-8")) for text in self._texts.values()),
+            }
+
+
+ARTICLE_STORE = ArticleStore()
@@ -0,0 +1,107 @@
+"""Memory benchmark: per-session footprint when many users cite the same stories.
+
+Run from the repository root:
+
+    python benchmarks/article_store_memory.py
+
+Each simulated session mirrors what app.py keeps alive per user: chat history whose
+references are compact {"url", "title"} dicts, and that session's NewsManager result cache,
+which holds the fetched articles for NEWS_CACHE_TTL_SECONDS. Each session asks a few
+questions whose answers cite articles drawn from a small pool of popular stories. Every fetch
+yields a fresh copy of the article text, as an Exa response would.
+
+Both layouts store identical chat history. They differ only in the cached articles: the
+legacy dataclass carries its own copy of the text, while NewsArticle handles share one copy
+per story through the ArticleStore.
+"""
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models
+from article_store import ArticleStore
+from models import NewsArticle
+
+STORIES = 5
+ARTICLE_CHARS = 20_000
+QUESTIONS_PER_SESSION = 3
+REFERENCES_PER_ANSWER = 2
+SESSION_COUNTS = [10, 100, 500]
+
+
+@dataclass
+class LegacyNewsArticle:
+    title: str
+    url: str
+    source: str
+    content: str
+
+
+def fetch_story(i: int) -> dict:
+    body = f"Story {i}: " + ("match report " * (ARTICLE_CHARS // 13))
+    return {
+        "title": f"Story {i}",
+        "url": f"https://example.com/story-{i}",
+        "source": "example.com",
+        # Build a new string object each time, like a fresh network response.
+        "content": "".join(list(body)),
+    }
+
+
+def build_sessions(sessions: int, article_cls) -> list:
+    all_sessions = []
+    for s in range(sessions):
+        messages, news_cache = [], {}
+        for q in range(QUESTIONS_PER_SESSION):
+            articles = [
+                article_cls(**fetch_story((s + q + r) % STORIES))
+                for r in range(REFERENCES_PER_ANSWER)
+            ]
+            news_cache[f"query {q}"] = articles
+            messages.append({
+                "role": "assistant",
+                "content": "answer",
+                "references": [{"url": article.url, "title": article.title} for article in articles],
+            })
+        all_sessions.append({"messages": messages, "news_cache": news_cache})
+    return all_sessions
+
+
+def measure(sessions: int, article_cls) -> tuple:
+    """Return (total traced bytes, bytes held by the article store) for one run.
+
+    Each run gets a fresh ArticleStore, so story text cached by an earlier run is not
+    silently excluded from the shared layout's total.
+    """
+    global_store = models.ARTICLE_STORE
+    models.ARTICLE_STORE = ArticleStore()
+    try:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        state = build_sessions(sessions, article_cls)
+        used = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        store_bytes = models.ARTICLE_STORE.stats()["bytes"]
+        del state
+    finally:
+        models.ARTICLE_STORE = global_store
+    return used, store_bytes
+
+
+def main():
+    print(f"{STORIES} stories x {ARTICLE_CHARS} chars, {QUESTIONS_PER_SESSION} answers/session, {REFERENCES_PER_ANSWER} refs/answer")
+    print(f"{'sessions':>8} | {'legacy KB/session':>17} | {'shared KB/session':>17} | {'store KB total':>14}")
+    for sessions in SESSION_COUNTS:
+        legacy, _ = measure(sessions, LegacyNewsArticle)
+        shared, store_bytes = measure(sessions, NewsArticle)
+        print(
+            f"{sessions:>8} | {legacy / sessions / 1024:>17.1f} | {shared / sessions / 1024:>17.1f} | "
+            f"{store_bytes / 1024:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,46 @@
 import streamlit as st
 import google.generativeai as genai
+from google.generativeai import caching
+from google.api_core import exceptions as google_exceptions
 from models import BotResponse
 from news_manager import NewsManager
-from config import GEMINI_MODEL
+from gazetteer import default_gazetteer
+from config import GEMINI_MODEL, CONTEXT_CACHE_TTL_SECONDS, CONTEXT_CACHE_MIN_CHARS
+import datetime
+import hashlib
 import re
+import textwrap
+import time
 import logger_config 
 import logging
 
+# Prompt templates are compiled once; the analyst rules travel as the model's system instruction.
+SYSTEM_INSTRUCTION = textwrap.dedent("""
+    You are an expert, direct football analyst. Your tone is confident and factual. Follow these rules strictly:
+    1. NEVER apologize or use words like "I'm sorry" or "unfortunately".
+    2. Speak only based on the provided article content.
+    3. If articles do not contain the answer, state clearly: 
+       "The provided articles do not contain information about [topic]."
+    4. Always include a time frame when mentioning statistics or events.
+    5. Write in a clear, professional analyst tone — concise, assertive, and accurate.
+""").strip()
+
+FALLBACK_PROMPT = textwrap.dedent("""
+    **PENTING:** Anda tidak memiliki artikel berita yang disediakan untuk dianalisis. Jawab pertanyaan pengguna berikut berdasarkan pengetahuan umum Anda sebagai analis sepak bola. Gunakan gaya bahasa yang percaya diri, faktual, dan hindari mengatakan bahwa Anda tidak menemukan artikel.
+
+    User question: {query}
+""").strip()
+
+ARTICLES_CONTEXT = "Articles to analyze:\n{article_contents}"
+
+QUESTION_PROMPT = textwrap.dedent("""
+    User question: {query}
+
+    Based ONLY on the content above, answer confidently and factually.
+""").strip()
+
+ARTICLE_TEMPLATE = "Article Title: {title}\nContent: {content}"
+
 class FootballChatbot:
     def __init__(self, gemini_api_key: str, exa_api_key: str, debug: bool = False):
         self.logger = logging.getLogger(__name__)
@@ -14,27 +48,35 @@ class FootballChatbot:
         self.logger.info("Initializing FootballChatbot...")
         genai.configure(api_key=gemini_api_key)
         self.news_manager = NewsManager(exa_api_key=exa_api_key)
-        self.model = self._initialize_model()
+        self.gazetteer = default_gazetteer()
         self.context = self._get_base_context()
+        self.safety_settings = [
+            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+        ]
+        self.generation_config = {
+            "temperature": 2,
+            "top_k": 40,
+            "max_output_tokens": 2048,
+        }
+        self.model = self._initialize_model()
+        self.caching_available = True
+        self._recent_contexts = {}
+        self._cached_contexts = {}
+        self.token_usage = {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0, "fresh_tokens": 0}
+        self.latency_stats = {}
         self.logger.info("FootballChatbot initialized successfully.")
 
     def _initialize_model(self):
         self.logger.info(f"Initializing Gemini Model: {GEMINI_MODEL}")
         try:
-            safety_settings = [
-                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-            ]
             model = genai.GenerativeModel(
                 GEMINI_MODEL,
-                safety_settings=safety_settings,
-                generation_config={
-                    "temperature": 2,
-                    "top_k": 40,
-                    "max_output_tokens": 2048,
-                },
+                safety_settings=self.safety_settings,
+                generation_config=self.generation_config,
+                system_instruction=self.context,
             )
             self.logger.info("Gemini model initialized successfully.")
             return model
@@ -44,15 +86,7 @@ class FootballChatbot:
             raise
 
     def _get_base_context(self) -> str:
-        return """
-        You are an expert, direct football analyst. Your tone is confident and factual. Follow these rules strictly:
-        1. NEVER apologize or use words like "I'm sorry" or "unfortunately".
-        2. Speak only based on the provided article content.
-        3. If articles do not contain the answer, state clearly: 
-           "The provided articles do not contain information about [topic]."
-        4. Always include a time frame when mentioning statistics or events.
-        5. Write in a clear, professional analyst tone — concise, assertive, and accurate.
-        """
+        return SYSTEM_INSTRUCTION
 
     def _get_football_keywords(self):
         return [
@@ -63,14 +97,8 @@ class FootballChatbot:
             "offside", "corner", "free kick", "yellow card", "red card", "substitution",
             "injury", "training", "lineup", "formation",
 
-            # Competitions
-            "premier league", "epl", "la liga", "laliga", "serie a", "bundesliga", "ligue 1",
-            "champions league", "europa league", "conference league", "world cup",
-            "uefa", "fifa", "afcon", "copa america", "asian cup",
-
-            # Clubs
-            "manchester united", "man city", "liverpool", "chelsea", "arsenal",
-            "real madrid", "barcelona", "psg", "bayern munich", "juventus", "inter milan",
+            # Governing bodies (clubs, players and competitions live in the gazetteer)
+            "uefa", "fifa",
 
             # Player roles
             "striker", "forward", "midfielder", "defender", "goalkeeper", "captain",
@@ -94,6 +122,11 @@ class FootballChatbot:
         normalized_query = re.sub(r"[^a-z0-9\s]", " ", normalized_query)
         normalized_query = re.sub(r"\s+", " ", normalized_query).strip()
 
+        entities = self.gazetteer.match(query)
+        if entities:
+            self.logger.info(f"Query is football-related. Found entity: '{entities[0][2].name}'")
+            return True
+
         merged_query = normalized_query.replace(" ", "")
 
         for keyword in football_keywords:
@@ -114,12 +147,92 @@ class FootballChatbot:
         self.logger.info("Query is not football-related.")
         return False
 
+    def _get_cached_model(self, article_context: str):
+        """Return a model bound to cached article context, or None to send the context inline.
 
-    # File: chatbot.py
+        A context is uploaded only the second time it is seen within the TTL window, so one-off
+        article sets never pay for a cache entry.
+        """
+        if not self.caching_available or len(article_context) < CONTEXT_CACHE_MIN_CHARS:
+            return None
+
+        key = hashlib.sha256(article_context.encode("utf-8")).hexdigest()
+        now = time.monotonic()
+        self._cached_contexts = {k: v for k, v in self._cached_contexts.items() if v[1] > now}
+        self._recent_contexts = {k: t for k, t in self._recent_contexts.items() if now - t < CONTEXT_CACHE_TTL_SECONDS}
 
-# ... (kode impor dan __init__ di atas) ...
+        if key in self._cached_contexts:
+            self.logger.info(f"Reusing cached article context {key[:12]}.")
+            return self._cached_contexts[key][0]
+        if key not in self._recent_contexts:
+            self._recent_contexts[key] = now
+            return None
 
-    def generate_response(self, query: str) -> BotResponse:
+        try:
+            model_name = GEMINI_MODEL if GEMINI_MODEL.startswith("models/") else f"models/{GEMINI_MODEL}"
+            cached_content = caching.CachedContent.create(
+                model=model_name,
+                display_name=f"socchat-{key[:12]}",
+                system_instruction=self.context,
+                contents=[article_context],
+                ttl=datetime.timedelta(seconds=CONTEXT_CACHE_TTL_SECONDS),
+            )
+            model = genai.GenerativeModel.from_cached_content(
+                cached_content=cached_content,
+                generation_config=self.generation_config,
+                safety_settings=self.safety_settings,
+            )
+        except (google_exceptions.NotFound, google_exceptions.FailedPrecondition,
+                google_exceptions.PermissionDenied) as e:
+            # The model or key cannot cache at all; stop trying for this session.
+            self.logger.warning(f"Context caching unsupported, sending article context inline from now on: {e}")
+            self.caching_available = False
+            return None
+        except google_exceptions.InvalidArgument as e:
+            # Usually this context is below the model's minimum cacheable size; larger ones may still cache.
+            self.logger.warning(f"Article context not cacheable, sending it inline for this request: {e}")
+            return None
+        except Exception as e:
+            self.logger.warning(f"Context caching failed, sending article context inline for this request: {e}")
+            return None
+
+        self._cached_contexts[key] = (model, now + CONTEXT_CACHE_TTL_SECONDS)
+        self.logger.info(f"Uploaded article context {key[:12]} as cached content.")
+        return model
+
+    def _record_token_usage(self, response):
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        prompt_tokens = usage.prompt_token_count or 0
+        cached_tokens = getattr(usage, "cached_content_token_count", 0) or 0
+        self.token_usage["requests"] += 1
+        self.token_usage["prompt_tokens"] += prompt_tokens
+        self.token_usage["cached_tokens"] += cached_tokens
+        self.token_usage["fresh_tokens"] += prompt_tokens - cached_tokens
+        requests = self.token_usage["requests"]
+        self.logger.info(
+            f"Input tokens: {prompt_tokens} total, {cached_tokens} from cache, {prompt_tokens - cached_tokens} newly ingested. "
+            f"Average per request: {self.token_usage['prompt_tokens'] / requests:.0f} without caching, "
+            f"{self.token_usage['fresh_tokens'] / requests:.0f} with caching."
+        )
+
+    def generate_response(self, query: str, request_type: str = "chat") -> BotResponse:
+        started = time.perf_counter()
+        try:
+            return self._generate_response(query, request_type)
+        finally:
+            elapsed = time.perf_counter() - started
+            profile = self.news_manager.get_profile(request_type).name
+            stats = self.latency_stats.setdefault(profile, {"requests": 0, "seconds": 0.0})
+            stats["requests"] += 1
+            stats["seconds"] += elapsed
+            self.logger.info(
+                f"End-to-end latency for profile '{profile}': {elapsed:.2f}s "
+                f"(average {stats['seconds'] / stats['requests']:.2f}s over {stats['requests']} requests)."
+            )
+
+    def _generate_response(self, query: str, request_type: str) -> BotResponse:
         self.logger.info(f"--- New Response Generation Started for Query: '{query}' ---")
         
         self.logger.info("Step 1: Filtering context.")
@@ -132,46 +245,41 @@ class FootballChatbot:
             )
 
         self.logger.info("Step 2: Fetching news articles using Exa.")
-        articles = self.news_manager.fetch_football_news(query)
+        search_query = self.gazetteer.canonicalize(query)
+        articles = self.news_manager.fetch_football_news(search_query.text, request_type=request_type)
+        model = self.model
         
-        # --- LOGIKA FALLBACK BARU: JIKA ARTIKEL KOSONG (dari Exa) ---
+        # --- FALLBACK: JIKA ARTIKEL KOSONG (dari Exa), Gemini memakai pengetahuan umumnya ---
         if not articles:
             self.logger.warning("No valid articles found from Exa. Activating Gemini fallback to use general knowledge.")
-            
-            # Prompt baru untuk meminta Gemini menjawab dengan pengetahuan umumnya.
-            prompt = f"""
-            {self.context}
-            
-            **PENTING:** Anda tidak memiliki artikel berita yang disediakan untuk dianalisis. Jawab pertanyaan pengguna berikut berdasarkan pengetahuan umum Anda sebagai analis sepak bola. Gunakan gaya bahasa yang percaya diri, faktual, dan hindari mengatakan bahwa Anda tidak menemukan artikel.
-            
-            User question: {query}
-            """
-            
+            prompt = FALLBACK_PROMPT.format(query=query)
         else:
             self.logger.info(f"Found {len(articles)} articles. Constructing standard prompt for Gemini.")
-            
-            # Prompt STANDAR: Menggunakan artikel yang ditemukan
-            article_contents = "\n\n".join(
-                f"Article Title: {article.title}\nContent: {article.content}"
+            article_context = ARTICLES_CONTEXT.format(article_contents="\n\n".join(
+                ARTICLE_TEMPLATE.format(title=article.title, content=article.content)
                 for article in articles
-            )
-            prompt = f"""
-            {self.context}
-
-            Articles to analyze:
-            {article_contents}
-
-            User question: {query}
-
-            Based ONLY on the content above, answer confidently and factually.
-            """
-        # --- AKHIR LOGIKA FALLBACK BARU ---
+            ))
+            question = QUESTION_PROMPT.format(query=query)
+            cached_model = self._get_cached_model(article_context)
+            if cached_model is not None:
+                model, prompt = cached_model, question
+            else:
+                prompt = f"{article_context}\n\n{question}"
         
         self.logger.info("Step 3: Prompt constructed successfully.")
         self.logger.info("Step 4: Calling Gemini API to generate content.")
         
         try:
-            response = self.model.generate_content(prompt)
+            if model is self.model:
+                response = model.generate_content(prompt)
+            else:
+                try:
+                    response = model.generate_content(prompt)
+                except Exception as e:
+                    self.logger.warning(f"Cached-context call failed, retrying with inline article context: {e}")
+                    self._cached_contexts.clear()
+                    response = self.model.generate_content(f"{article_context}\n\n{question}")
+            self._record_token_usage(response)
 
             # 1. Periksa apakah respons memiliki teks.
             if response.text.strip():
@@ -210,120 +318,3 @@ class FootballChatbot:
                 message="An error occurred while generating a response. Please check the logs.",
                 references=[],
             )
-
-        self.logger.info(f"--- New Response Generation Started for Query: '{query}' ---")
-        
-        self.logger.info("Step 1: Filtering context.")
-        if not self._is_football_related(query, self._get_football_keywords()):
-            self.logger.warning("Query failed football-related check. Returning generic response.")
-            return BotResponse(
-                message="I can only answer questions about football. Please ask me something related to football.",
-                references=[],
-            )
-
-        self.logger.info("Step 2: Fetching news articles.")
-        articles = self.news_manager.fetch_football_news(query)
-        if not articles:
-            self.logger.warning("No articles found for the query. Returning empty response.")
-            return BotResponse(
-                message="I've searched but couldn't find any articles matching your query. Try rephrasing or asking about a different football topic.",
-                references=[],
-            )
-        self.logger.info(f"Found {len(articles)} articles.")
-
-        self.logger.info("Step 3: Constructing prompt for Gemini.")
-        article_contents = "\n\n".join(
-            f"Article Title: {article.title}\nContent: {article.content}"
-            for article in articles
-        )
-        prompt = f"""
-        {self.context}
-
-        Articles to analyze:
-        {article_contents}
-
-        User question: {query}
-
-        Based ONLY on the content above, answer confidently and factually.
-        """
-        self.logger.info("Prompt constructed successfully.")
-
-        self.logger.info("Step 4: Calling Gemini API to generate content.")
-        try:
-            response = self.model.generate_content(prompt)
-
-            if not response.parts:
-                finish_reason = response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
-                self.logger.error(f"Gemini response was empty. Finish Reason: {finish_reason}")
-                return BotResponse(
-                    message="Gemini has blocked your question.",
-                    references=articles
-                )
-            
-            self.logger.info("Gemini API call successful. Response received.")
-            return BotResponse(message=response.text, references=articles)
-
-        except Exception as e:
-            self.logger.error(f"An unexpected error occurred during Gemini API call: {e}", exc_info=True)
-            if self.debug:
-                print("\n--- GEMINI API ERROR ---")
-                print(e)
-                print("-------------------------\n")
-            st.error("Error generating response. Check terminal logs for details.")
-            return BotResponse(
-                message="An error occurred while generating a response. Please check the logs.",
-                references=[],
-            )
-        self.logger.info(f"--- New Response Generation Started for Query: '{query}' ---")
-        
-        self.logger.info("Step 1: Filtering context.")
-        if not self._is_football_related(query, self._get_football_keywords()):
-            self.logger.warning("Query failed football-related check. Returning generic response.")
-            return BotResponse(
-                message="I can only answer questions about football. Please ask me something related to football.",
-                references=[],
-            )
-
-        self.logger.info("Step 2: Fetching news articles.")
-        articles = self.news_manager.fetch_football_news(query)
-        if not articles:
-            self.logger.warning("No articles found for the query. Returning empty response.")
-            return BotResponse(
-                message="I've searched but couldn't find any articles matching your query. Try rephrasing or asking about a different football topic.",
-                references=[],
-            )
-        self.logger.info(f"Found {len(articles)} articles.")
-
-        self.logger.info("Step 3: Constructing prompt for Gemini.")
-        article_contents = "\n\n".join(
-            f"Article Title: {article.title}\nContent: {article.content}"
-            for article in articles
-        )
-        prompt = f"""
-        {self.context}
-
-        Articles to analyze:
-        {article_contents}
-
-        User question: {query}
-
-        Based ONLY on the content above, answer confidently and factually.
-        """
-        self.logger.info("Prompt constructed successfully.")
-
-        self.logger.info("Step 4: Calling Gemini API to generate content.")
-        try:
-            response = self.model.generate_content(prompt)
-            self.logger.info("Gemini API call successful. Response received.")
-            return BotResponse(message=response.text, references=articles)
-        except Exception as e:
-            self.logger.error(f"Error during Gemini API call: {e}", exc_info=True)
-            if self.debug:
-                print("\n--- GEMINI API ERROR ---")
-                print(e)
-                print("-------------------------\n")
-            st.error("Error generating response. Check terminal logs for details.")
-            return BotResponse(
-                message="An error occurred while generating a response. Please check the logs.",
-                references=[],
-            )
\ No newline at end of file
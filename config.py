@@ -8,4 +8,21 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-logger.info(f"GEMINI_MODEL set to: {GEMINI_MODEL}")
\ No newline at end of file
+logger.info(f"GEMINI_MODEL set to: {GEMINI_MODEL}")
+
+FIXTURES_DIR = os.getenv("FIXTURES_DIR", "data/fixtures")
+FIXTURE_FEEDS = [url.strip() for url in os.getenv("FIXTURE_FEEDS", "").split(",") if url.strip()]
+FIXTURE_REFRESH_SECONDS = int(os.getenv("FIXTURE_REFRESH_SECONDS", "900"))
+logger.info(f"FIXTURES_DIR set to: {FIXTURES_DIR}, {len(FIXTURE_FEEDS)} fixture feed(s) configured, refresh every {FIXTURE_REFRESH_SECONDS}s")
+
+NEWS_CACHE_TTL_SECONDS = int(os.getenv("NEWS_CACHE_TTL_SECONDS", "600"))
+logger.info(f"NEWS_CACHE_TTL_SECONDS set to: {NEWS_CACHE_TTL_SECONDS}")
+
+RSS_REFRESH_SECONDS = int(os.getenv("RSS_REFRESH_SECONDS", "300"))
+HEADLINE_RETENTION_HOURS = int(os.getenv("HEADLINE_RETENTION_HOURS", "48"))
+NEWS_PAGE_SIZE = int(os.getenv("NEWS_PAGE_SIZE", "10"))
+logger.info(f"Headline index: refresh every {RSS_REFRESH_SECONDS}s, retention {HEADLINE_RETENTION_HOURS}h, page size {NEWS_PAGE_SIZE}")
+
+CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("CONTEXT_CACHE_TTL_SECONDS", "600"))
+CONTEXT_CACHE_MIN_CHARS = int(os.getenv("CONTEXT_CACHE_MIN_CHARS", "8000"))
+logger.info(f"Context caching: TTL {CONTEXT_CACHE_TTL_SECONDS}s, min context {CONTEXT_CACHE_MIN_CHARS} chars")
@@ -0,0 +1,276 @@
+import csv
+import io
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from models import Fixture
+from config import FIXTURES_DIR, FIXTURE_FEEDS, FIXTURE_REFRESH_SECONDS
+from gazetteer import default_gazetteer, normalize
+import logger_config
+import logging
+
+# Column names accepted in fixture files and feeds, mapped to Fixture fields.
+FIELD_ALIASES = {
+    "league": ["league", "competition", "tournament"],
+    "date": ["date", "match_date", "kickoff_date"],
+    "time": ["time", "kickoff", "kickoff_time"],
+    "home": ["home", "home_team", "home_club"],
+    "away": ["away", "away_team", "away_club"],
+    "matchday": ["matchday", "round", "gameweek"],
+    "venue": ["venue", "stadium"],
+}
+
+DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%d.%m.%Y"]
+
+
+def _normalize(name: str) -> str:
+    """Key a league or club name by its canonical gazetteer name, so aliases share one index entry."""
+    entity = default_gazetteer().lookup(name)
+    return normalize(entity.name if entity else name)
+
+
+def _parse_date(value: str) -> Optional[str]:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date().isoformat()
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+class FixtureManager:
+    """In-memory fixture store indexed by league and club."""
+
+    def __init__(self, fixtures_dir: str = FIXTURES_DIR, feed_urls: Optional[List[str]] = None,
+                 refresh_seconds: int = FIXTURE_REFRESH_SECONDS):
+        self.logger = logging.getLogger(__name__)
+        self.fixtures_dir = fixtures_dir
+        self.feed_urls = list(FIXTURE_FEEDS if feed_urls is None else feed_urls)
+        self.refresh_seconds = refresh_seconds
+        self._by_league: Dict[str, List[Fixture]] = {}
+        self._by_club: Dict[str, List[Fixture]] = {}
+        self._league_names: Dict[str, str] = {}
+        self._club_names: Dict[str, str] = {}
+        self._source_records: Dict[str, List[dict]] = {}
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+
+        indexed = self.refresh(force=True)
+        self.logger.info(
+            f"FixtureManager initialized with {indexed} fixtures "
+            f"across {len(self._league_names)} leagues."
+        )
+
+    # --- Ingestion ---
+
+    def refresh(self, force: bool = False) -> int:
+        """Reload fixture files and feeds when the last load is older than `refresh_seconds`.
+
+        The index is rebuilt from scratch so moved or postponed fixtures replace their old
+        entries. A source that fails to load keeps the records from its last good load.
+        Returns the number of fixtures indexed, or 0 when the refresh was skipped.
+        """
+        if not force and time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return 0
+        self._last_refresh = time.monotonic()
+        self.logger.info("Refreshing fixture index.")
+
+        paths = []
+        if self.fixtures_dir and os.path.isdir(self.fixtures_dir):
+            paths = [
+                os.path.join(self.fixtures_dir, filename)
+                for filename in sorted(os.listdir(self.fixtures_dir))
+                if filename.lower().endswith((".csv", ".json"))
+            ]
+        sources: Dict[str, List[dict]] = {}
+        for origin, records in [(path, self._read_file(path)) for path in paths] + [(url, self._read_feed(url)) for url in self.feed_urls]:
+            if records is None:
+                records = self._source_records.get(origin, [])
+                self.logger.warning(f"Keeping {len(records)} previously loaded fixtures for '{origin}'.")
+            sources[origin] = records
+
+        indexed = self._build([record for records in sources.values() for record in records])
+        self._source_records = sources
+        self.logger.info(f"Fixture index refreshed: {indexed} fixtures from {len(sources)} sources.")
+        return indexed
+
+    def _read_file(self, path: str) -> Optional[List[dict]]:
+        self.logger.info(f"Loading fixtures from file: '{path}'")
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error(f"Error reading fixture file '{path}': {e}", exc_info=True)
+            return None
+        return self._parse_text(text, is_json=path.lower().endswith(".json"), origin=path)
+
+    def _read_feed(self, url: str) -> Optional[List[dict]]:
+        self.logger.info(f"Loading fixtures from feed: '{url}'")
+        try:
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.error(f"Error fetching fixture feed '{url}': {e}", exc_info=True)
+            return None
+        is_json = "json" in response.headers.get("Content-Type", "") or url.lower().endswith(".json")
+        return self._parse_text(response.text, is_json=is_json, origin=url)
+
+    def _parse_text(self, text: str, is_json: bool, origin: str) -> Optional[List[dict]]:
+        try:
+            if is_json:
+                data = json.loads(text)
+                records = data.get("fixtures", []) if isinstance(data, dict) else data
+            else:
+                records = list(csv.DictReader(io.StringIO(text)))
+        except (ValueError, csv.Error) as e:
+            self.logger.error(f"Error parsing fixtures from '{origin}': {e}", exc_info=True)
+            return None
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            self.logger.error(f"Error parsing fixtures from '{origin}': expected a list of fixture objects.")
+            return None
+        return records
+
+    def _build(self, records: Iterable[dict]) -> int:
+        by_league: Dict[str, List[Fixture]] = {}
+        by_club: Dict[str, List[Fixture]] = {}
+        league_names: Dict[str, str] = {}
+        club_names: Dict[str, str] = {}
+        seen = set()
+        for record in records:
+            fixture = self._to_fixture(record)
+            if fixture is None:
+                continue
+            league_key, home_key, away_key = _normalize(fixture.league), _normalize(fixture.home), _normalize(fixture.away)
+            identity = (league_key, fixture.date, home_key, away_key)
+            if identity in seen:
+                continue
+            seen.add(identity)
+
+            league_names.setdefault(league_key, fixture.league)
+            by_league.setdefault(league_key, []).append(fixture)
+            for club_key, club_name in ((home_key, fixture.home), (away_key, fixture.away)):
+                club_names.setdefault(club_key, club_name)
+                by_club.setdefault(club_key, []).append(fixture)
+
+        for fixtures in (*by_league.values(), *by_club.values()):
+            fixtures.sort(key=self._sort_key)
+        with self._lock:
+            self._by_league, self._by_club = by_league, by_club
+            self._league_names, self._club_names = league_names, club_names
+        return len(seen)
+
+    def _to_fixture(self, record: dict) -> Optional[Fixture]:
+        values = {}
+        lowered = {str(k).strip().lower(): v for k, v in record.items() if k is not None}
+        for field, aliases in FIELD_ALIASES.items():
+            for alias in aliases:
+                value = lowered.get(alias)
+                if value not in (None, ""):
+                    values[field] = str(value).strip()
+                    break
+
+        if not all(values.get(field) for field in ("league", "date", "home", "away")):
+            self.logger.warning(f"Skipping incomplete fixture record: {record}")
+            return None
+        parsed_date = _parse_date(values["date"])
+        if parsed_date is None:
+            self.logger.warning(f"Skipping fixture with unparseable date: {record}")
+            return None
+        if values.get("time") is None and "T" in values["date"]:
+            values["time"] = values["date"].split("T", 1)[1][:5]
+        values["date"] = parsed_date
+        return Fixture(**values)
+
+    @staticmethod
+    def _sort_key(fixture: Fixture) -> Tuple[str, str]:
+        return fixture.date, fixture.time or ""
+
+    # --- Lookup ---
+
+    def resolve(self, name: str) -> Optional[Tuple[str, str]]:
+        """Return ("league" | "club", key) when the whole name is an indexed league or club.
+
+        Only exact canonical matches count, so "Premier League 2" or "Chelsea Women" fall
+        back to web search instead of being answered with another competition's fixtures.
+        """
+        query = _normalize(name)
+        if not query:
+            return None
+        with self._lock:
+            for kind, names in (("league", self._league_names), ("club", self._club_names)):
+                if query in names:
+                    return kind, query
+        return None
+
+    def upcoming_matchdays(self, league_key: str, count: int = 3, today: Optional[date] = None) -> List[Tuple[str, List[Fixture]]]:
+        fixtures = self._upcoming(self._by_league.get(league_key, []), today)
+        groups: List[Tuple[str, List[Fixture]]] = []
+        for fixture in fixtures:
+            label = f"Matchday {fixture.matchday}" if fixture.matchday else fixture.date
+            if groups and groups[-1][0] == label:
+                groups[-1][1].append(fixture)
+            elif len(groups) < count:
+                groups.append((label, [fixture]))
+            else:
+                break
+        return groups
+
+    def upcoming_for_club(self, club_key: str, count: int = 3, today: Optional[date] = None) -> List[Fixture]:
+        return self._upcoming(self._by_club.get(club_key, []), today)[:count]
+
+    def _upcoming(self, fixtures: List[Fixture], today: Optional[date]) -> List[Fixture]:
+        start = (today or date.today()).isoformat()
+        index = bisect_left(fixtures, (start, ""), key=self._sort_key)
+        return fixtures[index:]
+
+    # --- Rendering ---
+
+    def answer_schedule(self, name: str, matchdays: int = 3, today: Optional[date] = None) -> Optional[str]:
+        """Build a markdown schedule for a league or club, or None when the index cannot answer it."""
+        with self._lock:
+            return self._answer_schedule(name, matchdays, today)
+
+    def _answer_schedule(self, name: str, matchdays: int, today: Optional[date]) -> Optional[str]:
+        resolved = self.resolve(name)
+        if resolved is None:
+            self.logger.info(f"No local fixtures cover '{name}'.")
+            return None
+        kind, key = resolved
+
+        if kind == "league":
+            groups = self.upcoming_matchdays(key, matchdays, today)
+            title = f"**{self._league_names[key]}: next {len(groups)} matchday(s)**"
+        else:
+            fixtures = self.upcoming_for_club(key, matchdays, today)
+            groups = [(f"{self._club_names[key]} fixtures", fixtures)] if fixtures else []
+            title = f"**{self._club_names[key]}: next {len(fixtures)} match(es)**"
+
+        if not groups:
+            self.logger.info(f"Fixtures for '{name}' are indexed but none are upcoming.")
+            return None
+
+        sections = [title]
+        for label, fixtures in groups:
+            rows = [
+                f"| {f.date} | {f.time or 'TBD'} | {f.home} | {f.away} | {f.venue or '-'} |"
+                for f in fixtures
+            ]
+            sections.append(
+                f"\n**{label}**\n\n| Date | Time | Home | Away | Venue |\n|---|---|---|---|---|\n" + "\n".join(rows)
+            )
+        self.logger.info(f"Answered schedule for '{name}' from local index ({kind}: {key}).")
+        return "\n".join(sections)
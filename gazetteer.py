@@ -0,0 +1,189 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from models import Entity
+import logger_config
+import logging
+
+CLUBS = [
+    Entity("Manchester United", "club", ("man united", "man utd", "manchester utd", "mufc", "man u")),
+    Entity("Manchester City", "club", ("man city", "mcfc", "manchester city fc")),
+    Entity("Liverpool", "club", ("liverpool fc", "lfc")),
+    Entity("Chelsea", "club", ("chelsea fc", "cfc")),
+    Entity("Arsenal", "club", ("arsenal fc", "the gunners")),
+    Entity("Tottenham Hotspur", "club", ("tottenham", "thfc")),
+    Entity("Newcastle United", "club", ("newcastle", "nufc")),
+    Entity("Aston Villa", "club", ("avfc",)),
+    Entity("Everton", "club", ("everton fc", "efc")),
+    Entity("West Ham United", "club", ("west ham", "whufc")),
+    Entity("Real Madrid", "club", ("real madrid cf", "los blancos")),
+    Entity("Barcelona", "club", ("fc barcelona", "barca", "barça")),
+    Entity("Atletico Madrid", "club", ("atletico", "atlético madrid", "atleti")),
+    Entity("Bayern Munich", "club", ("bayern", "fc bayern", "bayern munchen", "bayern münchen")),
+    Entity("Borussia Dortmund", "club", ("dortmund", "bvb")),
+    Entity("Bayer Leverkusen", "club", ("leverkusen",)),
+    Entity("Paris Saint-Germain", "club", ("psg", "paris sg", "paris saint germain")),
+    Entity("Juventus", "club", ("juve", "juventus fc")),
+    Entity("Inter Milan", "club", ("internazionale", "fc internazionale")),
+    Entity("AC Milan", "club", ("ac milan",)),
+    Entity("Napoli", "club", ("ssc napoli",)),
+    Entity("AS Roma", "club", ("as roma",)),
+    Entity("Ajax", "club", ("afc ajax",)),
+    Entity("Benfica", "club", ("sl benfica",)),
+    Entity("Porto", "club", ("fc porto",)),
+    Entity("Celtic", "club", ("celtic fc",)),
+]
+
+PLAYERS = [
+    Entity("Erling Haaland", "player", ("haaland",)),
+    Entity("Mohamed Salah", "player", ("salah", "mo salah")),
+    Entity("Kylian Mbappe", "player", ("mbappe", "mbappé")),
+    Entity("Harry Kane", "player", ()),
+    Entity("Jude Bellingham", "player", ("bellingham",)),
+    Entity("Bukayo Saka", "player", ("saka",)),
+    Entity("Cole Palmer", "player", ()),
+    Entity("Vinicius Junior", "player", ("vinicius", "vini jr", "vinicius jr")),
+    Entity("Lamine Yamal", "player", ("yamal",)),
+    Entity("Robert Lewandowski", "player", ("lewandowski",)),
+    Entity("Kevin De Bruyne", "player", ("de bruyne", "kdb")),
+    Entity("Rodri", "player", ("rodrigo hernandez",)),
+    Entity("Lionel Messi", "player", ("messi", "leo messi")),
+    Entity("Cristiano Ronaldo", "player", ("cr7",)),
+]
+
+COMPETITIONS = [
+    Entity("Premier League", "competition", ("epl", "english premier league", "barclays premier league")),
+    Entity("La Liga", "competition", ("laliga", "spanish la liga", "primera division")),
+    Entity("Serie A", "competition", ("italian serie a", "seriea")),
+    Entity("Bundesliga", "competition", ("german bundesliga",)),
+    Entity("Ligue 1", "competition", ("french ligue 1", "ligue1")),
+    Entity("Champions League", "competition", ("uefa champions league", "ucl")),
+    Entity("Europa League", "competition", ("uefa europa league", "uel")),
+    Entity("Conference League", "competition", ("uefa conference league", "uecl")),
+    Entity("FA Cup", "competition", ("emirates fa cup",)),
+    Entity("World Cup", "competition", ("fifa world cup",)),
+    Entity("Copa America", "competition", ("copa américa",)),
+    Entity("Africa Cup of Nations", "competition", ("afcon",)),
+    Entity("Asian Cup", "competition", ("afc asian cup",)),
+]
+
+# Filler words dropped from search strings, and intent words collapsed onto one term.
+STOPWORDS = {
+    "a", "an", "the", "about", "me", "please", "what", "whats", "is", "are", "any",
+    "on", "for", "of", "give", "tell", "show", "can", "you", "i", "want", "to", "some",
+}
+INTENT_SYNONYMS = {
+    "latest": "news", "updates": "news", "update": "news", "headlines": "news", "info": "news",
+    "fixtures": "schedule", "fixture": "schedule", "games": "schedule",
+    "scores": "score", "results": "result",
+}
+
+_ENTITY_KEY = "$"
+
+# Aliases are deliberately multi-word or unmistakable: bare common words such as "villa",
+# "inter" or "kane" would tag unrelated queries as football entities.
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and punctuation, drop possessive 's and keep scores/dates like 2-0."""
+    text = text.replace("\u2019", "'")
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    text = re.sub(r"'s\b", "", text).replace("'", "")
+    text = re.sub(r"(?<=\d)-(?=\d)", "\x00", text)
+    text = re.sub(r"[^a-z0-9\s\x00]", " ", text).replace("\x00", "-")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+@dataclass
+class CanonicalQuery:
+    text: str
+    entities: List[Entity]
+
+
+class Gazetteer:
+    """Token trie of club, player and competition aliases with longest-match lookup."""
+
+    def __init__(self, entities: Optional[List[Entity]] = None):
+        self.logger = logging.getLogger(__name__)
+        self._root: Dict = {}
+        self._aliases: List[str] = []
+        for entity in entities or []:
+            self.add(entity)
+        self.logger.info(f"Gazetteer built with {len(self._aliases)} aliases.")
+
+    def add(self, entity: Entity):
+        for alias in (entity.name, *entity.aliases):
+            tokens = normalize(alias).split()
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_ENTITY_KEY] = entity
+            self._aliases.append(" ".join(tokens))
+
+    def aliases(self) -> List[str]:
+        return list(self._aliases)
+
+    def match(self, text: str) -> List[Tuple[int, int, Entity]]:
+        """Return (start, end, entity) token spans, scanning left to right and preferring the longest alias."""
+        tokens = normalize(text).split()
+        spans = []
+        i = 0
+        while i < len(tokens):
+            node, best = self._root, None
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if _ENTITY_KEY in node:
+                    best = (i, j + 1, node[_ENTITY_KEY])
+            if best:
+                spans.append(best)
+                i = best[1]
+            else:
+                i += 1
+        return spans
+
+    def lookup(self, name: str) -> Optional[Entity]:
+        """Return the entity whose alias is exactly `name`, if any."""
+        node = self._root
+        for token in normalize(name).split():
+            node = node.get(token)
+            if node is None:
+                return None
+        return node.get(_ENTITY_KEY)
+
+    def canonicalize(self, query: str) -> CanonicalQuery:
+        """Rewrite a user query into a stable, entity-tagged search string."""
+        tokens = normalize(query).split()
+        spans = {start: (end, entity) for start, end, entity in self.match(query)}
+        parts, entities = [], []
+        i = 0
+        while i < len(tokens):
+            if i in spans:
+                # Repeated mentions of the same entity collapse; every other token keeps its place.
+                end, entity = spans[i]
+                if entity not in entities:
+                    entities.append(entity)
+                    parts.append(entity.name)
+                i = end
+            else:
+                token = tokens[i]
+                if token not in STOPWORDS:
+                    parts.append(INTENT_SYNONYMS.get(token, token))
+                i += 1
+
+        if not parts:
+            return CanonicalQuery(text=query.strip(), entities=[])
+        canonical = CanonicalQuery(text=" ".join(parts), entities=entities)
+        self.logger.info(f"Canonicalized query '{query}' -> '{canonical.text}'")
+        return canonical
+
+
+@lru_cache(maxsize=1)
+def default_gazetteer() -> Gazetteer:
+    return Gazetteer(CLUBS + PLAYERS + COMPETITIONS)
@@ -0,0 +1,143 @@
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rss_manager import fetch_rss_entries
+from gazetteer import STOPWORDS, default_gazetteer, normalize
+from config import HEADLINE_RETENTION_HOURS, RSS_REFRESH_SECONDS
+import logger_config
+import logging
+
+# Words that describe the request rather than the story ("everything on Chelsea today").
+QUERY_FILLER = {"everything", "all", "today", "news", "latest", "stories", "headlines", "updates", "update", "now"}
+
+
+def _entity_token(entity) -> str:
+    """Reserved posting key for one entity, e.g. '@manchester-united'; never collides with a word."""
+    return "@" + normalize(entity.name).replace(" ", "-")
+
+
+class HeadlineIndex:
+    """Incrementally updated inverted index over RSS headlines and summaries."""
+
+    def __init__(self, retention_hours: int = HEADLINE_RETENTION_HOURS, refresh_seconds: int = RSS_REFRESH_SECONDS):
+        self.logger = logging.getLogger(__name__)
+        self.retention_seconds = retention_hours * 3600
+        self.refresh_seconds = refresh_seconds
+        self._entries: Dict[str, dict] = {}
+        self._tokens: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._ordered: Optional[List[str]] = None
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self, feed_urls: List[str], force: bool = False) -> int:
+        """Pull the feeds when the last refresh is older than `refresh_seconds`; returns entries added."""
+        if not force and time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return 0
+        self.logger.info(f"Refreshing headline index from {len(feed_urls)} feeds.")
+        entries = fetch_rss_entries(feed_urls)
+        with self._lock:
+            self._last_refresh = time.monotonic()
+            added = self._add(entries)
+            evicted = self._evict(time.time())
+        self.logger.info(f"Headline index refreshed: {added} added, {evicted} evicted, {len(self._entries)} total.")
+        return added
+
+    def add(self, entries: Iterable[dict]) -> int:
+        with self._lock:
+            return self._add(entries)
+
+    def evict(self, now: Optional[float] = None) -> int:
+        with self._lock:
+            return self._evict(time.time() if now is None else now)
+
+    def _add(self, entries: Iterable[dict]) -> int:
+        added = 0
+        now = time.time()
+        for entry in entries:
+            link = entry.get("link")
+            if not link or link in self._entries:
+                continue
+            entry = dict(entry)
+            entry["published_ts"] = entry.get("published_ts") or now
+            if now - entry["published_ts"] > self.retention_seconds:
+                continue
+            tokens = self._index_tokens(f"{entry.get('title', '')} {entry.get('summary', '')}")
+            self._entries[link] = entry
+            self._tokens[link] = tokens
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(link)
+            added += 1
+        if added:
+            self._ordered = None
+        return added
+
+    def _evict(self, now: float) -> int:
+        expired = [link for link, entry in self._entries.items() if now - entry["published_ts"] > self.retention_seconds]
+        for link in expired:
+            del self._entries[link]
+            for token in self._tokens.pop(link):
+                postings = self._postings[token]
+                postings.discard(link)
+                if not postings:
+                    del self._postings[token]
+        if expired:
+            self._ordered = None
+        return len(expired)
+
+    @staticmethod
+    def _index_tokens(text: str) -> Set[str]:
+        tokens = set(normalize(text).split())
+        tokens.update(_entity_token(entity) for _, _, entity in default_gazetteer().match(text))
+        return tokens
+
+    @staticmethod
+    def _query_tokens(query: str) -> Tuple[Set[str], Set[str]]:
+        """Split a query into entity keys (required) and other keywords (used for ranking)."""
+        words = normalize(query).split()
+        spans = default_gazetteer().match(query)
+        covered = {i for start, end, _ in spans for i in range(start, end)}
+        required = {_entity_token(entity) for _, _, entity in spans}
+        keywords = {
+            word for i, word in enumerate(words)
+            if i not in covered and word not in STOPWORDS and word not in QUERY_FILLER
+        }
+        return required, keywords
+
+    def search(self, query: str = "", page: int = 1, page_size: int = 10) -> Tuple[List[dict], int]:
+        """Return one page of matching entries plus the total match count.
+
+        Entries must mention every entity in the query; other keywords only rank them, so a
+        word that appears in no headline does not empty the results. Ties go to the newest.
+        """
+        with self._lock:
+            if self._ordered is None:
+                self._ordered = sorted(self._entries, key=lambda link: self._entries[link]["published_ts"], reverse=True)
+            required, keywords = self._query_tokens(query)
+            if required:
+                postings = sorted((self._postings.get(token, set()) for token in required), key=len)
+                matches = set.intersection(*postings)
+            elif keywords:
+                matches = set().union(*(self._postings.get(token, set()) for token in keywords))
+            else:
+                matches = None
+
+            if matches is None:
+                links = self._ordered
+            else:
+                links = sorted(
+                    matches,
+                    key=lambda link: (len(keywords & self._tokens[link]), self._entries[link]["published_ts"]),
+                    reverse=True,
+                )
+            start = (max(page, 1) - 1) * page_size
+            return [self._entries[link] for link in links[start:start + page_size]], len(links)
+
+    @staticmethod
+    def page_count(total: int, page_size: int) -> int:
+        return max(1, math.ceil(total / page_size))
@@ -1,14 +1,70 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
+from article_store import ARTICLE_STORE
 
-@dataclass
 class NewsArticle:
-    title: str
-    url: str
-    source: str
-    content: str
+    """Compact handle to an article whose text lives once in the shared ARTICLE_STORE."""
+
+    __slots__ = ("content_hash", "title", "url", "source")
+
+    def __init__(self, title: str, url: str, source: str, content: str):
+        self.content_hash = ARTICLE_STORE.acquire(content)
+        self.title = title
+        self.url = url
+        self.source = source
+
+    @property
+    def content(self) -> str:
+        return ARTICLE_STORE.get(self.content_hash)
+
+    def __del__(self):
+        content_hash = getattr(self, "content_hash", None)
+        if content_hash and ARTICLE_STORE is not None:
+            ARTICLE_STORE.release_later(content_hash)
+
+    def __reduce__(self):
+        return NewsArticle, (self.title, self.url, self.source, self.content)
+
+    def __copy__(self):
+        return NewsArticle(self.title, self.url, self.source, self.content)
+
+    def __eq__(self, other):
+        if not isinstance(other, NewsArticle):
+            return NotImplemented
+        return (self.content_hash, self.title, self.url, self.source) == (other.content_hash, other.title, other.url, other.source)
+
+    def __hash__(self):
+        return hash((self.content_hash, self.url))
+
+    def __repr__(self):
+        return f"NewsArticle(title={self.title!r}, url={self.url!r}, source={self.source!r}, content_hash={self.content_hash[:12]!r})"
 
 @dataclass
 class BotResponse:
     message: str
-    references: List[NewsArticle]
\ No newline at end of file
+    references: List[NewsArticle]
+
+@dataclass
+class Fixture:
+    league: str
+    date: str
+    home: str
+    away: str
+    time: Optional[str] = None
+    matchday: Optional[str] = None
+    venue: Optional[str] = None
+
+@dataclass(frozen=True)
+class Entity:
+    name: str
+    kind: str
+    aliases: Tuple[str, ...] = ()
+
+@dataclass(frozen=True)
+class RetrievalProfile:
+    name: str
+    mode: str
+    max_characters: Optional[int] = None
+    initial_results: int = 2
+    max_results: int = 4
+    min_content_chars: int = 2000
@@ -1,52 +1,130 @@
 import streamlit as st
+import time
 from exa_py import Exa
-from typing import List
-from models import NewsArticle
+from typing import Dict, List, Optional, Tuple
+from models import NewsArticle, RetrievalProfile
+from config import NEWS_CACHE_TTL_SECONDS
 import logger_config # Impor untuk mengaktifkan konfigurasi
 import logging
 
+# Retrieval profile per request type. Modes: "highlights" (key sentences only),
+# "capped" (text cut at max_characters) or "full" (entire article body).
+RETRIEVAL_PROFILES = {
+    "chat": RetrievalProfile("chat", "capped", max_characters=4000, initial_results=2, max_results=4, min_content_chars=2000),
+    "news": RetrievalProfile("news", "highlights", initial_results=3, max_results=6, min_content_chars=1200),
+    "schedule": RetrievalProfile("schedule", "capped", max_characters=3000, initial_results=2, max_results=4, min_content_chars=1500),
+    "analysis": RetrievalProfile("analysis", "capped", max_characters=6000, initial_results=2, max_results=4, min_content_chars=4000),
+    "prediction": RetrievalProfile("prediction", "full", initial_results=3, max_results=6, min_content_chars=8000),
+}
+
+HIGHLIGHTS_OPTIONS = {"num_sentences": 3, "highlights_per_url": 4}
+
 class NewsManager:
     def __init__(self, exa_api_key: str):
         self.logger = logging.getLogger(__name__)
         self.logger.info("NewsManager initialized.")
         self.exa_client = Exa(api_key=exa_api_key)
+        self._cache: Dict[Tuple[str, str], Tuple[float, List[NewsArticle]]] = {}
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def get_profile(self, request_type: str) -> RetrievalProfile:
+        return RETRIEVAL_PROFILES.get(request_type, RETRIEVAL_PROFILES["chat"])
+
+    def fetch_football_news(self, query: str, request_type: str = "chat", max_results: Optional[int] = None) -> List[NewsArticle]:
+        profile = self.get_profile(request_type)
+        self.logger.info(f"Fetching football news for query: '{query}' with profile '{profile.name}' ({profile.mode})")
+        cache_key = (query.lower(), profile.name)
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < NEWS_CACHE_TTL_SECONDS:
+            self.logger.info(f"Serving {len(cached[1])} cached articles for query: '{query}'")
+            return list(cached[1])
 
-    def fetch_football_news(self, query: str, max_results: int = 2) -> List[NewsArticle]:
-        self.logger.info(f"Fetching football news for query: '{query}'")
+        started = time.perf_counter()
+        stats = self.stats.setdefault(profile.name, {"requests": 0, "exa_calls": 0, "expansions": 0, "bytes": 0, "seconds": 0.0})
+        stats["requests"] += 1
         try:
-            search_response = self.exa_client.search_and_contents(
-                query,
-                num_results=max_results,
-                text=True,
-                highlights=False
-            )
-            self.logger.info(f"Exa API call successful. Found {len(search_response.results)} potential articles.")
+            initial_results = min(profile.initial_results, max_results or profile.initial_results)
+            articles, downloaded = self._search(query, profile, initial_results)
+            stats["exa_calls"] += 1
+            stats["bytes"] += downloaded
 
-            with st.expander("Analyzing...", expanded=False):
-                st.write(f"Found {len(search_response.results)} results from Exa.")
-                for i, result in enumerate(search_response.results):
-                    st.write(f"Result {i+1} Title: {result.title}")
-                    st.write(f"Result {i+1} has content: {bool(result.text and result.text.strip())}")
+            # Exa has no offset, so expanding repeats the search with a larger result count.
+            expand_to = max_results or profile.max_results
+            content_chars = sum(len(article.content) for article in articles)
+            if expand_to > initial_results and (len(articles) < initial_results or content_chars < profile.min_content_chars):
+                self.logger.info(
+                    f"Insufficient content ({len(articles)} articles, {content_chars} chars). "
+                    f"Expanding search to {expand_to} results."
+                )
+                more_articles, downloaded = self._search(query, profile, expand_to)
+                stats["exa_calls"] += 1
+                stats["expansions"] += 1
+                stats["bytes"] += downloaded
+                seen_urls = {article.url for article in articles}
+                articles += [article for article in more_articles if article.url not in seen_urls]
 
-            articles = []
-            for i, result in enumerate(search_response.results):
-                self.logger.info(f"Processing article {i+1}/{len(search_response.results)}: '{result.title}'")
-                content = result.text
-                if content and content.strip():
-                    articles.append(NewsArticle(
-                        title=result.title or 'No Title Available',
-                        url=result.url or '#',
-                        source=result.url.split('/')[2] if result.url else 'Unknown Source',
-                        content=content
-                    ))
-                    self.logger.info(f"Article '{result.title}' is valid and has been added.")
-                else:
-                    self.logger.warning(f"Article '{result.title}' skipped due to empty content.")
-            
             self.logger.info(f"Finished processing. Total valid articles: {len(articles)}")
-            return articles
+            if articles:
+                now = time.monotonic()
+                self._cache = {key: entry for key, entry in self._cache.items() if now - entry[0] < NEWS_CACHE_TTL_SECONDS}
+                self._cache[cache_key] = (now, articles)
+            return list(articles)
 
         except Exception as e:
             self.logger.error(f"Error fetching news from Exa: {e}", exc_info=True)
             st.warning(f"Error fetching news from Exa: {e}. No articles could be retrieved.")
-            return []
\ No newline at end of file
+            return []
+
+        finally:
+            stats["seconds"] += time.perf_counter() - started
+            self.logger.info(
+                f"Profile '{profile.name}': {stats['requests']} requests, {stats['exa_calls']} Exa calls, "
+                f"{stats['expansions']} expansions, {stats['bytes'] / stats['requests']:.0f} bytes and "
+                f"{stats['seconds'] / stats['requests']:.2f}s per request on average."
+            )
+
+    def _search(self, query: str, profile: RetrievalProfile, num_results: int) -> Tuple[List[NewsArticle], int]:
+        if profile.mode == "highlights":
+            text, highlights = False, HIGHLIGHTS_OPTIONS
+        elif profile.mode == "capped":
+            text, highlights = {"max_characters": profile.max_characters}, False
+        else:
+            text, highlights = True, False
+
+        search_response = self.exa_client.search_and_contents(
+            query,
+            num_results=num_results,
+            text=text,
+            highlights=highlights
+        )
+        self.logger.info(f"Exa API call successful. Found {len(search_response.results)} potential articles.")
+
+        with st.expander("Analyzing...", expanded=False):
+            st.write(f"Found {len(search_response.results)} results from Exa ({profile.mode}).")
+            for i, result in enumerate(search_response.results):
+                st.write(f"Result {i+1} Title: {result.title}")
+                st.write(f"Result {i+1} has content: {bool(self._result_content(result, profile).strip())}")
+
+        articles = []
+        downloaded = 0
+        for i, result in enumerate(search_response.results):
+            self.logger.info(f"Processing article {i+1}/{len(search_response.results)}: '{result.title}'")
+            content = self._result_content(result, profile)
+            downloaded += len(content.encode("utf-8")) + len((result.title or "").encode("utf-8")) + len((result.url or "").encode("utf-8"))
+            if content.strip():
+                articles.append(NewsArticle(
+                    title=result.title or 'No Title Available',
+                    url=result.url or '#',
+                    source=result.url.split('/')[2] if result.url else 'Unknown Source',
+                    content=content
+                ))
+                self.logger.info(f"Article '{result.title}' is valid and has been added.")
+            else:
+                self.logger.warning(f"Article '{result.title}' skipped due to empty content.")
+        return articles, downloaded
+
+    @staticmethod
+    def _result_content(result, profile: RetrievalProfile) -> str:
+        if profile.mode == "highlights":
+            return "\n".join(getattr(result, "highlights", None) or [])
+        return getattr(result, "text", None) or ""
@@ -0,0 +1,54 @@
+import copy
+import gc
+import pickle
+
+from article_store import ARTICLE_STORE, ArticleStore
+from models import NewsArticle
+
+
+def test_released_text_stays_until_pushed_out_of_lru():
+    store = ArticleStore(max_unreferenced=2)
+    first = store.acquire("first story")
+    store.release(first)
+    assert store.get(first) == "first story"
+
+    for text in ("second story", "third story"):
+        store.release(store.acquire(text))
+    assert store.get(first) == ""
+    assert store.stats()["entries"] == 2
+
+
+def test_reacquire_removes_text_from_lru():
+    store = ArticleStore(max_unreferenced=1)
+    key = store.acquire("popular story")
+    store.release(key)
+    assert store.acquire("popular story") == key
+
+    for text in ("other story", "another story"):
+        store.release(store.acquire(text))
+    assert store.get(key) == "popular story"
+    assert store.refcount(key) == 1
+
+
+def test_release_later_is_applied_on_next_access():
+    store = ArticleStore()
+    key = store.acquire("story")
+    store.release_later(key)
+    assert store.refcount(key) == 0
+    assert store.stats()["referenced"] == 0
+
+
+def test_copy_and_pickle_take_their_own_reference():
+    article = NewsArticle("Title", "https://example.com/a", "example.com", "shared copy test body")
+    key = article.content_hash
+    assert ARTICLE_STORE.refcount(key) == 1
+
+    copied = copy.copy(article)
+    restored = pickle.loads(pickle.dumps(article))
+    assert copied == article and restored == article
+    assert ARTICLE_STORE.refcount(key) == 3
+
+    del copied, restored
+    gc.collect()
+    assert ARTICLE_STORE.refcount(key) == 1
+    assert article.content == "shared copy test body"
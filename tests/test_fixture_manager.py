@@ -0,0 +1,39 @@
+import json
+from datetime import date
+
+from fixture_manager import FixtureManager
+
+CSV_HEADER = "league,matchday,date,time,home,away\n"
+
+
+def write(path, text, encoding="utf-8"):
+    path.write_text(text, encoding=encoding)
+
+
+def test_exact_names_and_aliases_resolve(tmp_path):
+    write(tmp_path / "epl.csv", CSV_HEADER + "Premier League,9,2030-01-05,15:00,Arsenal,Chelsea\n")
+    manager = FixtureManager(str(tmp_path), feed_urls=[])
+    assert manager.resolve("EPL") == ("league", "premier league")
+    assert manager.resolve("Chelsea FC") == ("club", "chelsea")
+    assert manager.resolve("Premier League 2") is None
+    assert manager.resolve("Chelsea Women") is None
+    assert "Arsenal" in manager.answer_schedule("Premier League", today=date(2030, 1, 1))
+
+
+def test_bad_sources_keep_last_good_records(tmp_path):
+    write(tmp_path / "epl.csv", CSV_HEADER + "Premier League,9,2030-01-05,15:00,Arsenal,Chelsea\n")
+    write(tmp_path / "liga.json", json.dumps({"fixtures": [{"league": "La Liga", "date": "2030-01-06", "home": "Barcelona", "away": "Real Madrid"}]}))
+    manager = FixtureManager(str(tmp_path), feed_urls=[])
+    assert manager.resolve("La Liga") == ("league", "la liga")
+
+    write(tmp_path / "epl.csv", CSV_HEADER + "Premier League,9,2030-01-05,15:00,Atlético,Chelsea\n", encoding="cp1252")
+    write(tmp_path / "liga.json", json.dumps({"fixtures": [["La Liga", "2030-01-01"]]}))
+    assert manager.refresh(force=True) == 2
+    assert manager.resolve("Arsenal") == ("club", "arsenal")
+    assert manager.resolve("La Liga") == ("league", "la liga")
+
+
+def test_new_bad_source_is_skipped(tmp_path):
+    write(tmp_path / "broken.json", "[1, 2, 3]")
+    manager = FixtureManager(str(tmp_path), feed_urls=[])
+    assert manager.resolve("Premier League") is None
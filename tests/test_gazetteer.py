@@ -0,0 +1,31 @@
+from gazetteer import default_gazetteer, normalize
+
+
+def canonical(query):
+    return default_gazetteer().canonicalize(query).text
+
+
+def test_aliases_collapse_onto_one_search_string():
+    assert canonical("Man Utd news") == "Manchester United news"
+    assert canonical("manchester united news") == "Manchester United news"
+    assert canonical("MUFC latest") == "Manchester United news"
+
+
+def test_repeated_plain_tokens_and_scores_are_kept():
+    assert canonical("Did Chelsea win 2-0 or 2-1 on 2025-10-04?") == "did Chelsea win 2-0 or 2-1 2025-10-04"
+    assert canonical("Arsenal 1-1 Chelsea") == "Arsenal 1-1 Chelsea"
+
+
+def test_only_repeated_entities_are_dropped():
+    assert canonical("Chelsea vs Chelsea FC reserves") == "Chelsea vs reserves"
+
+
+def test_apostrophes_are_handled_before_stopwords():
+    assert normalize("What's Haaland’s role?") == "what haaland role"
+    assert canonical("What's the latest on Inter Milan?") == "news Inter Milan"
+    assert canonical("Haaland's contract") == "Erling Haaland contract"
+
+
+def test_common_words_are_not_entities():
+    assert default_gazetteer().match("villa for rent") == []
+    assert default_gazetteer().match("kane and palmer in rome") == []
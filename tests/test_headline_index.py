@@ -0,0 +1,54 @@
+import time
+
+from headline_index import HeadlineIndex
+
+
+def build_index():
+    now = time.time()
+    index = HeadlineIndex(retention_hours=48)
+    index.add([
+        {"title": "Chelsea sign new striker", "link": "a", "summary": "", "published_ts": now - 300},
+        {"title": "Man Utd beat Chelsea in late drama", "link": "b", "summary": "Winner in stoppage time", "published_ts": now - 100},
+        {"title": "Liverpool draw at home", "link": "c", "summary": "", "published_ts": now - 50},
+        {"title": "Old Chelsea story", "link": "d", "summary": "", "published_ts": now - 3 * 86400},
+    ])
+    return index
+
+
+def links(results):
+    return [entry["link"] for entry in results[0]]
+
+
+def test_filler_words_do_not_empty_results():
+    index = build_index()
+    assert links(index.search("everything on Chelsea today")) == ["b", "a"]
+    assert links(index.search("chelsea news")) == ["b", "a"]
+
+
+def test_keywords_rank_instead_of_filter():
+    index = build_index()
+    assert links(index.search("chelsea striker")) == ["a", "b"]
+    assert links(index.search("manchester united")) == ["b"]
+
+
+def test_pagination_and_eviction():
+    index = build_index()
+    assert index.search("", page=2, page_size=2)[1] == 3
+    assert links(index.search("", page=2, page_size=2)) == ["a"]
+    index.evict(time.time() + 48 * 3600)
+    assert len(index) == 0
+    assert index.search("chelsea") == ([], 0)
+
+
+def test_entities_match_as_a_whole():
+    now = time.time()
+    index = HeadlineIndex(retention_hours=48)
+    index.add([
+        {"title": "Manchester City thrash Newcastle United", "link": "a", "summary": "", "published_ts": now - 200},
+        {"title": "Real Betis beat Atletico Madrid", "link": "b", "summary": "", "published_ts": now - 100},
+        {"title": "Man Utd held at home", "link": "c", "summary": "", "published_ts": now - 50},
+    ])
+    assert links(index.search("Man Utd")) == ["c"]
+    assert links(index.search("everything on Manchester United")) == ["c"]
+    assert links(index.search("Real Madrid")) == []
+    assert links(index.search("Atletico")) == ["b"]
@@ -0,0 +1,97 @@
+import contextlib
+from types import SimpleNamespace
+
+import pytest
+
+import news_manager
+from news_manager import NewsManager
+
+
+class FakeExa:
+    """Returns results 0..num_results-1 for every search, so expanded searches repeat URLs."""
+
+    def __init__(self, text_length=1500, empty_urls=()):
+        self.text_length = text_length
+        self.empty_urls = set(empty_urls)
+        self.calls = []
+
+    def search_and_contents(self, query, num_results, text, highlights):
+        self.calls.append({"query": query, "num_results": num_results, "text": text, "highlights": highlights})
+        results = []
+        for i in range(num_results):
+            body = "" if i in self.empty_urls else "x" * self.text_length
+            results.append(SimpleNamespace(
+                title=f"Story {i}",
+                url=f"https://example.com/{i}",
+                text=body if text else None,
+                highlights=[body] if highlights else None,
+            ))
+        return SimpleNamespace(results=results)
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    monkeypatch.setattr(news_manager, "st", SimpleNamespace(
+        expander=lambda *args, **kwargs: contextlib.nullcontext(),
+        write=lambda *args, **kwargs: None,
+        warning=lambda *args, **kwargs: None,
+    ))
+    monkeypatch.setattr(news_manager, "Exa", lambda api_key: None)
+
+    def make(**fake_options):
+        manager = NewsManager(exa_api_key="test")
+        manager.exa_client = FakeExa(**fake_options)
+        return manager
+
+    return make
+
+
+def test_sufficient_content_uses_one_small_request(make_manager):
+    manager = make_manager(text_length=1500)
+    articles = manager.fetch_football_news("chelsea news")
+    assert len(articles) == 2
+    assert [call["num_results"] for call in manager.exa_client.calls] == [2]
+    assert manager.exa_client.calls[0]["text"] == {"max_characters": 4000}
+    assert manager.stats["chat"]["expansions"] == 0
+
+
+def test_short_content_expands_and_dedupes_urls(make_manager):
+    manager = make_manager(text_length=100)
+    articles = manager.fetch_football_news("chelsea news")
+    assert [call["num_results"] for call in manager.exa_client.calls] == [2, 4]
+    assert [article.url for article in articles] == [f"https://example.com/{i}" for i in range(4)]
+    assert manager.stats["chat"]["expansions"] == 1
+
+
+def test_too_few_articles_expands(make_manager):
+    manager = make_manager(text_length=5000, empty_urls={1})
+    articles = manager.fetch_football_news("chelsea news")
+    assert [call["num_results"] for call in manager.exa_client.calls] == [2, 4]
+    assert [article.url for article in articles] == ["https://example.com/0", "https://example.com/2", "https://example.com/3"]
+
+
+def test_max_results_clamps_initial_and_expansion(make_manager):
+    manager = make_manager(text_length=100)
+    articles = manager.fetch_football_news("chelsea news", request_type="prediction", max_results=1)
+    assert len(articles) == 1
+    assert [call["num_results"] for call in manager.exa_client.calls] == [1]
+    assert manager.exa_client.calls[0]["text"] is True
+
+
+def test_cache_is_keyed_per_profile(make_manager):
+    manager = make_manager(text_length=5000)
+    manager.fetch_football_news("Chelsea news")
+    manager.fetch_football_news("chelsea news")
+    assert len(manager.exa_client.calls) == 1
+
+    articles = manager.fetch_football_news("chelsea news", request_type="news")
+    assert len(manager.exa_client.calls) == 2
+    assert manager.exa_client.calls[1]["text"] is False
+    assert manager.exa_client.calls[1]["highlights"] == news_manager.HIGHLIGHTS_OPTIONS
+    assert articles[0].content == "x" * 5000
+
+
+def test_unknown_request_type_falls_back_to_chat_profile(make_manager):
+    manager = make_manager()
+    manager.fetch_football_news("chelsea news", request_type="unknown")
+    assert "chat" in manager.stats